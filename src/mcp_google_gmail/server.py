@@ -11,33 +11,54 @@ Authentication priority:
     5. Application Default Credentials (GOOGLE_APPLICATION_CREDENTIALS / gcloud)
 """
 
+import asyncio
 import base64
-import email
 import json
 import mimetypes
+import mmap
 import os
+import stat
 import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
 from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from email import encoders
+from email.generator import BytesGenerator
+from email.mime.application import MIMEApplication
 from email.mime.audio import MIMEAudio
 from email.mime.base import MIMEBase
 from email.mime.image import MIMEImage
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from email.utils import formataddr, getaddresses
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
 import google.auth
 import google.auth.transport.requests
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
 from mcp.server.fastmcp import Context, FastMCP
 
+try:
+    import orjson
+except ImportError:  # optional: faster parsing of API responses
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -61,51 +82,161 @@ _resolved_port = int(os.environ.get("PORT", os.environ.get("FASTMCP_PORT", "8000
 
 @dataclass
 class GmailContext:
-    """Context holding the authenticated Gmail service."""
+    """Context holding the authenticated Gmail service and its HTTP connection."""
 
     service: Any
+    http: Any = None
 
 
-def _authenticate() -> Any:
-    """Build an authenticated Gmail API service using the credential chain."""
-    creds = None
+def _creds_from_config() -> Any:
+    """1. Base64-encoded service account from env var."""
+    if not CREDENTIALS_CONFIG:
+        return None
+    info = json.loads(base64.b64decode(CREDENTIALS_CONFIG))
+    return service_account.Credentials.from_service_account_info(info, scopes=SCOPES)
 
-    # 1. Base64-encoded service account from env var
-    if CREDENTIALS_CONFIG:
-        info = json.loads(base64.b64decode(CREDENTIALS_CONFIG))
-        creds = service_account.Credentials.from_service_account_info(
-            info, scopes=SCOPES
-        )
 
-    # 2. Service account JSON file
-    if not creds and Path(SERVICE_ACCOUNT_PATH).exists():
-        creds = service_account.Credentials.from_service_account_file(
-            SERVICE_ACCOUNT_PATH, scopes=SCOPES
-        )
+def _creds_from_service_account_file() -> Any:
+    """2. Service account JSON file."""
+    try:
+        info = json.loads(Path(SERVICE_ACCOUNT_PATH).read_bytes())
+    except FileNotFoundError:
+        return None
+    return service_account.Credentials.from_service_account_info(info, scopes=SCOPES)
+
+
+def _save_token(creds: Any) -> None:
+    """Persist OAuth credentials atomically, skipping unchanged tokens.
+
+    The token is written to a uniquely named temp file (created 0600) and
+    renamed over the original, which keeps the original file's mode.
+    """
+    new_bytes = creds.to_json().encode()
+    token_path = Path(TOKEN_PATH)
+    try:
+        if token_path.read_bytes() == new_bytes:
+            return
+        mode = stat.S_IMODE(token_path.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o600
+    with tempfile.NamedTemporaryFile(
+        dir=token_path.parent,
+        prefix=token_path.name + ".",
+        suffix=".tmp",
+        delete=False,
+    ) as tmp:
+        tmp.write(new_bytes)
+    try:
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, token_path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
+def _creds_from_token_file() -> Any:
+    """3. Existing OAuth token, refreshed if expired."""
+    try:
+        info = json.loads(Path(TOKEN_PATH).read_bytes())
+    except FileNotFoundError:
+        return None
+    creds = Credentials.from_authorized_user_info(info, SCOPES)
+    if not creds.valid and creds.expired and creds.refresh_token:
+        creds.refresh(Request())
+        _save_token(creds)
+    return creds if creds.valid else None
+
+
+def _creds_from_oauth_flow() -> Any:
+    """4. Interactive OAuth flow; the resulting token is saved for next time."""
+    try:
+        flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_PATH, SCOPES)
+    except FileNotFoundError:
+        return None
+    creds = flow.run_local_server(port=0)
+    _save_token(creds)
+    return creds
+
+
+def _creds_from_default() -> Any:
+    """5. Application Default Credentials."""
+    creds, _ = google.auth.default(scopes=SCOPES)
+    return creds
+
+
+# Credential chain in priority order, keyed by method name.
+_AUTH_METHODS = {
+    "credentials_config": _creds_from_config,
+    "service_account_file": _creds_from_service_account_file,
+    "token_file": _creds_from_token_file,
+    "oauth_flow": _creds_from_oauth_flow,
+    "application_default": _creds_from_default,
+}
+
+
+def _load_credentials() -> tuple[Any, str | None]:
+    """Resolve credentials by trying each method in priority order.
+
+    Returns the credentials and the name of the method that produced them.
+    """
+    for method, loader in _AUTH_METHODS.items():
+        creds = loader()
+        if creds:
+            return creds, method
+    return None, None
 
-    # 3. Existing OAuth token
-    if not creds and Path(TOKEN_PATH).exists():
-        creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
-
-    # 4. Refresh or interactive OAuth flow
-    if not creds or not creds.valid:
-        if (
-            creds
-            and hasattr(creds, "expired")
-            and creds.expired
-            and hasattr(creds, "refresh_token")
-            and creds.refresh_token
-        ):
-            creds.refresh(Request())
-            Path(TOKEN_PATH).write_text(creds.to_json())
-        elif Path(CREDENTIALS_PATH).exists():
-            flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_PATH, SCOPES)
-            creds = flow.run_local_server(port=0)
-            Path(TOKEN_PATH).write_text(creds.to_json())
-
-    # 5. Application Default Credentials
-    if not creds:
-        creds, _ = google.auth.default(scopes=SCOPES)
+
+class _ThreadLocalHttp:
+    """``AuthorizedHttp`` facade that gives every thread its own connection.
+
+    Tool calls run on worker threads and httplib2 connections are not
+    thread-safe, so each thread lazily gets a keep-alive ``AuthorizedHttp``
+    sharing the same credentials. Expired credentials are refreshed by one
+    thread at a time, and with ``save_token`` the refreshed token is
+    written back to GMAIL_TOKEN_PATH.
+    """
+
+    def __init__(self, credentials: Any, save_token: bool = False) -> None:
+        self.credentials = credentials
+        self.save_token = save_token
+        self._local = threading.local()
+        self._refresh_lock = threading.Lock()
+
+    def _http(self) -> Any:
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.credentials, http=build_http()
+            )
+            self._local.http = http
+        return http
+
+    def ensure_fresh(self) -> None:
+        """Refresh expired credentials under the lock and save the new token."""
+        if self.credentials.valid:
+            return
+        with self._refresh_lock:
+            if self.credentials.valid:
+                return
+            http = self._http()
+            self.credentials.refresh(google_auth_httplib2.Request(http.http))
+            if self.save_token:
+                try:
+                    _save_token(self.credentials)
+                except OSError:
+                    pass  # a read-only token file must not fail the API call
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        self.ensure_fresh()
+        return self._http().request(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._http(), name)
+
+
+def _authorized_http() -> Any:
+    """Resolve credentials and wrap them in per-thread keep-alive connections."""
+    creds, method = _load_credentials()
 
     if not creds:
         raise RuntimeError(
@@ -114,15 +245,68 @@ def _authenticate() -> Any:
             "GMAIL_TOKEN_PATH, or GMAIL_CREDENTIALS_PATH."
         )
 
-    return build("gmail", "v1", credentials=creds)
+    return _ThreadLocalHttp(creds, save_token=method in ("token_file", "oauth_flow"))
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that parses API responses with orjson.
+
+    Request bodies keep using the stdlib encoder, which escapes non-ASCII
+    characters so bodies stay safe for http.client's latin-1 encoding.
+    """
+
+    def deserialize(self, content: bytes | str) -> Any:
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
+def _build_service(http: Any) -> Any:
+    # The Gmail discovery document ships with google-api-python-client, so
+    # there is no need to fetch it or to probe for a discovery cache.
+    return build(
+        "gmail",
+        "v1",
+        http=http,
+        model=_OrjsonModel() if orjson else None,
+        static_discovery=True,
+        cache_discovery=False,
+    )
+
+
+def _authenticate() -> Any:
+    """Build an authenticated Gmail API service using the credential chain."""
+    return _build_service(_authorized_http())
+
+
+_context: GmailContext | None = None
+_context_lock = threading.Lock()
+
+
+def _get_or_create_context() -> GmailContext:
+    """Return the process-wide Gmail context, authenticating on first use.
+
+    Every tool call goes through the same ``_ThreadLocalHttp``, so the TLS
+    connections to gmail.googleapis.com are kept alive between calls.
+    """
+    global _context
+    with _context_lock:
+        if _context is None:
+            http = _authorized_http()
+            _context = GmailContext(service=_build_service(http), http=http)
+        return _context
 
 
 @asynccontextmanager
 async def gmail_lifespan(server: FastMCP) -> AsyncIterator[GmailContext]:
-    """Create the Gmail service once at startup."""
-    service = _authenticate()
+    """Provide the Gmail service, created once per process."""
+    context = _get_or_create_context()
     try:
-        yield GmailContext(service=service)
+        yield context
     finally:
         pass
 
@@ -149,33 +333,196 @@ def _get_service(ctx: Context) -> Any:
     return ctx.request_context.lifespan_context.service
 
 
+def _get_http(ctx: Context) -> Any:
+    """Extract the service's HTTP connection from the lifespan context."""
+    return ctx.request_context.lifespan_context.http
+
+
+# ---------------------------------------------------------------------------
+# Helper: batched API requests
+# ---------------------------------------------------------------------------
+
+# Gmail accepts up to 100 calls per batch but recommends at most 50, since
+# every call still counts against the per-user concurrency limit.
+BATCH_SIZE = 50
+# Calls in a batch that fail with these statuses are retried with backoff.
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_BATCH_RETRIES = 3
+# messages.batchModify accepts at most 1000 message IDs per call.
+BATCH_MODIFY_SIZE = 1000
+# Below this many requests a batch round trip is not worth its overhead.
+MIN_BATCH_SIZE = 4
+MAX_WORKERS = 10
+
+# Shared across calls so worker threads, and with them their per-thread
+# keep-alive connections, are reused instead of re-created each time.
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="gmail")
+
+
+def _error_result(exception: Exception) -> dict:
+    if isinstance(exception, HttpError) and exception.resp is not None:
+        return {"error": str(exception), "status_code": exception.resp.status}
+    return {"error": str(exception)}
+
+
+async def _execute(request: Any) -> dict:
+    """Execute an API request on a worker thread, keeping the event loop free."""
+    return await asyncio.to_thread(request.execute)
+
+
+def _execute_concurrently(requests: list) -> list[dict]:
+    """Execute API requests on a thread pool, preserving input order."""
+
+    def _run(request: Any) -> dict:
+        try:
+            return request.execute()
+        except Exception as e:
+            return _error_result(e)
+
+    if len(requests) <= 1:
+        return [_run(request) for request in requests]
+    return list(_executor.map(_run, requests))
+
+
+def _execute_batch(service: Any, requests: list, http: Any = None) -> list[dict]:
+    """Execute API requests via Gmail batch calls, preserving input order.
+
+    Each result is the response dict, or an ``{"error": ...}`` dict if that
+    individual request failed. Calls rejected as rate-limited or with a server
+    error are retried in a new batch, waiting 1s, 2s and 4s between rounds.
+    Small request lists, and any chunk whose batch cannot be built, are
+    executed concurrently on a thread pool instead. An error for the batch
+    call as a whole is reported for every request in the chunk rather than
+    replayed; HTTP errors are then retried like per-call errors, transport
+    errors such as timeouts are not.
+
+    ``http`` is the ``_ThreadLocalHttp`` the service was built with, if any.
+    """
+    if len(requests) < MIN_BATCH_SIZE:
+        return _execute_concurrently(requests)
+
+    results: list[dict] = [{} for _ in requests]
+
+    def _callback(request_id: str, response: dict, exception: Exception) -> None:
+        if exception is None:
+            results[int(request_id)] = response
+        else:
+            results[int(request_id)] = _error_result(exception)
+
+    def _run_chunk(indices: list[int]) -> None:
+        chunk = [requests[i] for i in indices]
+        # BatchHttpRequest.execute() refreshes expired credentials on its own,
+        # bypassing the facade's lock and token saving, so refresh them first.
+        if http is not None:
+            http.ensure_fresh()
+        try:
+            batch = service.new_batch_http_request(callback=_callback)
+            for i in indices:
+                batch.add(requests[i], request_id=str(i))
+        except Exception:
+            for i, result in zip(indices, _execute_concurrently(chunk)):
+                results[i] = result
+            return
+        try:
+            batch.execute()
+        except (HttpError, httplib2.HttpLib2Error, OSError) as e:
+            for i in indices:
+                results[i] = _error_result(e)
+
+    pending = list(range(len(requests)))
+    for attempt in range(MAX_BATCH_RETRIES + 1):
+        if attempt:
+            time.sleep(2 ** (attempt - 1))
+        for start in range(0, len(pending), BATCH_SIZE):
+            _run_chunk(pending[start : start + BATCH_SIZE])
+        pending = [
+            i
+            for i in pending
+            if results[i].get("status_code") in RETRY_STATUS_CODES
+        ]
+        if not pending:
+            break
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Helper: MIME message building
 # ---------------------------------------------------------------------------
 
 
+# Attachments above this size are base64-encoded straight from an mmap, so the
+# raw file contents are never copied into a Python bytes object.
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+_ext_type_cache: dict[str, tuple[str, str]] = {}
+
+
+def _guess_type(path: Path) -> tuple[str, str]:
+    # Key on the suffixes guess_type looks at: the last one, plus the one
+    # before it when the last is a compression suffix (e.g. ".tar.gz").
+    ext = path.suffix.lower()
+    if ext in mimetypes.encodings_map:
+        ext = "".join(path.suffixes[-2:]).lower()
+    if ext not in _ext_type_cache:
+        content_type, _ = mimetypes.guess_type("attachment" + ext)
+        if content_type is None:
+            content_type = "application/octet-stream"
+        main_type, sub_type = content_type.split("/", 1)
+        _ext_type_cache[ext] = (main_type, sub_type)
+    return _ext_type_cache[ext]
+
+
 def _attach_file(message: MIMEMultipart, file_path: str) -> None:
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"Attachment not found: {file_path}")
-    content_type, _ = mimetypes.guess_type(str(path))
-    if content_type is None:
-        content_type = "application/octet-stream"
-    main_type, sub_type = content_type.split("/", 1)
-    file_data = path.read_bytes()
-    if main_type == "text":
-        att = MIMEText(file_data.decode(), _subtype=sub_type)
-    elif main_type == "image":
-        att = MIMEImage(file_data, _subtype=sub_type)
-    elif main_type == "audio":
-        att = MIMEAudio(file_data, _subtype=sub_type)
-    else:
+    main_type, sub_type = _guess_type(path)
+    if main_type != "text" and path.stat().st_size > MMAP_THRESHOLD:
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            encoded = base64.encodebytes(mm).decode("ascii")
         att = MIMEBase(main_type, sub_type)
-        att.set_payload(file_data)
+        att.set_payload(encoded)
+        att["Content-Transfer-Encoding"] = "base64"
+    else:
+        file_data = path.read_bytes()
+        if main_type == "text":
+            att = MIMEText(file_data.decode(), _subtype=sub_type)
+        elif main_type == "image":
+            att = MIMEImage(file_data, _subtype=sub_type)
+        elif main_type == "audio":
+            att = MIMEAudio(file_data, _subtype=sub_type)
+        elif main_type == "application":
+            att = MIMEApplication(file_data, _subtype=sub_type)
+        else:
+            att = MIMEBase(main_type, sub_type)
+            att.set_payload(file_data)
+            encoders.encode_base64(att)
     att.add_header("Content-Disposition", "attachment", filename=path.name)
     message.attach(att)
 
 
+def _encode_addresses(value: str) -> str:
+    """RFC 2047-encode non-ASCII display names, leaving the addresses intact.
+
+    compat32 would otherwise encode the whole header, addresses included.
+    Values with non-ASCII addresses, or that do not split cleanly into
+    name/address pairs, are returned unchanged.
+    """
+    if value.isascii():
+        return value
+    try:
+        return ", ".join(
+            formataddr(pair, charset="utf-8")
+            for pair in getaddresses([value])
+            if any(pair)
+        )
+    except UnicodeEncodeError:
+        return value
+
+
 def _build_message(
     to: str,
     subject: str,
@@ -208,17 +555,21 @@ def _build_message(
     else:
         message = MIMEText(body, "plain")
 
-    message["To"] = to
+    message["To"] = _encode_addresses(to)
     message["Subject"] = subject
     if cc:
-        message["Cc"] = cc
+        message["Cc"] = _encode_addresses(cc)
     if bcc:
-        message["Bcc"] = bcc
+        message["Bcc"] = _encode_addresses(bcc)
     if reply_to_message_id:
         message["In-Reply-To"] = reply_to_message_id
         message["References"] = reply_to_message_id
 
-    encoded = base64.urlsafe_b64encode(message.as_bytes()).decode()
+    # Flatten straight into a buffer and encode its memoryview, avoiding the
+    # extra copy of the serialized message that as_bytes() returns.
+    buffer = BytesIO()
+    BytesGenerator(buffer, mangle_from_=False).flatten(message)
+    encoded = base64.urlsafe_b64encode(buffer.getbuffer()).decode("ascii")
     result = {"raw": encoded}
     if thread_id:
         result["threadId"] = thread_id
@@ -230,50 +581,122 @@ def _build_message(
 # ---------------------------------------------------------------------------
 
 
+FULL_MESSAGE_HEADERS = frozenset({"Subject", "From", "To", "Cc", "Date"})
+LIST_HEADERS = frozenset({"Subject", "From", "Date"})
+SEARCH_HEADERS = frozenset({"Subject", "From", "To", "Date"})
+DRAFT_HEADERS = frozenset({"Subject", "To"})
+UPDATE_DRAFT_HEADERS = frozenset({"Subject", "To", "Cc", "Bcc"})
+
+
+def _pick_headers(payload: dict, wanted: frozenset[str]) -> dict[str, str]:
+    """Collect the wanted headers, stopping once all of them have been seen.
+
+    If a header repeats, the first occurrence wins.
+    """
+    found: dict[str, str] = {}
+    for header in payload.get("headers", []):
+        name = header["name"]
+        if name in wanted and name not in found:
+            found[name] = header["value"]
+            if len(found) == len(wanted):
+                break
+    return found
+
+
+def _decode_body_data(data: str) -> str:
+    # CPython's UTF-8 decoder already has an ASCII fast path; a separate
+    # isascii() check plus an ASCII decode only adds a second pass. Likewise
+    # b64decode(altchars=b"-_") performs the same translate() internally as
+    # urlsafe_b64decode, so neither variant is faster.
+    return base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
+
+
+# Parts of these types never contain the message body, so body searches do
+# not descend into them.
+_ATTACHMENT_MAIN_TYPES = frozenset({"application", "image", "audio", "video"})
+
+
+def _is_attachment_type(mime_type: str) -> bool:
+    return mime_type.partition("/")[0] in _ATTACHMENT_MAIN_TYPES
+
+
 def _extract_body(payload: dict) -> tuple[str, str]:
+    # Walk the MIME tree depth-first in document order without recursion;
+    # the first text/plain and text/html parts win. Attachment-type parts
+    # never hold the body, so they are not pushed onto the stack at all.
     body_text = ""
     body_html = ""
-    mime_type = payload.get("mimeType", "")
-
-    if mime_type == "text/plain" and "body" in payload:
-        data = payload["body"].get("data", "")
-        if data:
-            body_text = base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
-    elif mime_type == "text/html" and "body" in payload:
-        data = payload["body"].get("data", "")
-        if data:
-            body_html = base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
-    elif "parts" in payload:
-        for part in payload["parts"]:
-            t, h = _extract_body(part)
-            if t and not body_text:
-                body_text = t
-            if h and not body_html:
-                body_html = h
+    stack = deque([payload])
+    while stack:
+        part = stack.popleft()
+        mime_type = part.get("mimeType", "")
+        if mime_type == "text/plain" and "body" in part:
+            data = part["body"].get("data", "")
+            if data and not body_text:
+                body_text = _decode_body_data(data)
+        elif mime_type == "text/html" and "body" in part:
+            data = part["body"].get("data", "")
+            if data and not body_html:
+                body_html = _decode_body_data(data)
+        elif "parts" in part:
+            stack.extendleft(
+                child
+                for child in reversed(part["parts"])
+                if not _is_attachment_type(child.get("mimeType", ""))
+            )
+        if body_text and body_html:
+            break
     return body_text, body_html
 
 
-def _extract_attachments(payload: dict) -> list[dict]:
+def _extract_body_and_attachments(payload: dict) -> tuple[str, str, list[dict]]:
+    """Collect the bodies (as _extract_body would) and attachments in one walk.
+
+    Each stack entry carries whether its part can still supply a body: like
+    _extract_body, the walk does not look for bodies in attachment-type parts
+    or anywhere below them or below a text part. Unlike _extract_body, it
+    still visits those parts to collect attachments.
+    """
+    body_text = ""
+    body_html = ""
     attachments = []
-    if payload.get("filename"):
-        body = payload.get("body", {})
-        attachments.append(
-            {
-                "filename": payload["filename"],
-                "mime_type": payload.get("mimeType", ""),
-                "size": body.get("size", 0),
-                "attachment_id": body.get("attachmentId", ""),
-            }
+    stack = deque([(payload, True)])
+    while stack:
+        part, body_candidate = stack.popleft()
+        if part.get("filename"):
+            body = part.get("body", {})
+            attachments.append(
+                {
+                    "filename": part["filename"],
+                    "mime_type": part.get("mimeType", ""),
+                    "size": body.get("size", 0),
+                    "attachment_id": body.get("attachmentId", ""),
+                }
+            )
+        mime_type = part.get("mimeType", "")
+        is_text = mime_type in ("text/plain", "text/html") and "body" in part
+        if body_candidate and is_text:
+            data = part["body"].get("data", "")
+            if data and mime_type == "text/plain" and not body_text:
+                body_text = _decode_body_data(data)
+            elif data and mime_type == "text/html" and not body_html:
+                body_html = _decode_body_data(data)
+        children_candidate = body_candidate and not is_text
+        stack.extendleft(
+            (
+                child,
+                children_candidate
+                and not _is_attachment_type(child.get("mimeType", "")),
+            )
+            for child in reversed(part.get("parts", []))
         )
-    for part in payload.get("parts", []):
-        attachments.extend(_extract_attachments(part))
-    return attachments
+    return body_text, body_html, attachments
 
 
 def _parse_full_message(msg: dict) -> dict:
-    headers = {h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])}
-    body_text, body_html = _extract_body(msg.get("payload", {}))
-    attachment_list = _extract_attachments(msg.get("payload", {}))
+    payload = msg.get("payload", {})
+    headers = _pick_headers(payload, FULL_MESSAGE_HEADERS)
+    body_text, body_html, attachment_list = _extract_body_and_attachments(payload)
     return {
         "id": msg["id"],
         "thread_id": msg["threadId"],
@@ -289,38 +712,22 @@ def _parse_full_message(msg: dict) -> dict:
     }
 
 
-def _parse_raw_draft(raw_data: str) -> dict:
-    if not raw_data:
-        return {}
-    msg_bytes = base64.urlsafe_b64decode(raw_data)
-    msg = email.message_from_bytes(msg_bytes)
-    body = ""
-    html_body = None
-    if msg.is_multipart():
-        for part in msg.walk():
-            ct = part.get_content_type()
-            if ct == "text/plain" and not body:
-                p = part.get_payload(decode=True)
-                if p:
-                    body = p.decode("utf-8", errors="replace")
-            elif ct == "text/html" and not html_body:
-                p = part.get_payload(decode=True)
-                if p:
-                    html_body = p.decode("utf-8", errors="replace")
-    else:
-        p = msg.get_payload(decode=True)
-        if p:
-            if msg.get_content_type() == "text/html":
-                html_body = p.decode("utf-8", errors="replace")
-            else:
-                body = p.decode("utf-8", errors="replace")
+def _parse_draft_message(msg: dict) -> dict:
+    """Read the editable fields of a draft fetched with ``format="full"``.
+
+    In this format attachment parts carry only an ``attachmentId``, so
+    attachment data is never downloaded or decoded.
+    """
+    payload = msg.get("payload", {})
+    headers = _pick_headers(payload, UPDATE_DRAFT_HEADERS)
+    body_text, body_html = _extract_body(payload)
     return {
-        "to": msg.get("To", ""),
-        "subject": msg.get("Subject", ""),
-        "cc": msg.get("Cc"),
-        "bcc": msg.get("Bcc"),
-        "body": body,
-        "html_body": html_body,
+        "to": headers.get("To", ""),
+        "subject": headers.get("Subject", ""),
+        "cc": headers.get("Cc"),
+        "bcc": headers.get("Bcc"),
+        "body": body_text,
+        "html_body": body_html or None,
     }
 
 
@@ -330,13 +737,14 @@ def _parse_raw_draft(raw_data: str) -> dict:
 
 
 @mcp.tool()
-def gmail_list_messages(
+async def gmail_list_messages(
     ctx: Context,
     query: str | None = None,
     label_ids: list[str] | None = None,
     max_results: int = 20,
     page_token: str | None = None,
     include_spam_trash: bool = False,
+    include_headers: bool = True,
 ) -> dict:
     """List messages from the user's mailbox.
 
@@ -347,6 +755,9 @@ def gmail_list_messages(
         max_results: Maximum messages to return (1-500, default 20).
         page_token: Token for the next page of results.
         include_spam_trash: Include SPAM and TRASH in results.
+        include_headers: Fetch snippet, subject, from and date for each message.
+            Set to False to get only IDs in a single API call (e.g. for bulk
+            label or trash operations).
     """
     try:
         service = _get_service(ctx)
@@ -362,23 +773,40 @@ def gmail_list_messages(
         if page_token:
             kwargs["pageToken"] = page_token
 
-        response = service.users().messages().list(**kwargs).execute()
-        messages = []
-        for stub in response.get("messages", []):
-            msg = (
+        response = await _execute(service.users().messages().list(**kwargs))
+        stubs = response.get("messages", [])
+        if not include_headers:
+            return {
+                "messages": [
+                    {"id": stub["id"], "thread_id": stub["threadId"]}
+                    for stub in stubs
+                ],
+                "next_page_token": response.get("nextPageToken"),
+                "result_size_estimate": response.get("resultSizeEstimate", 0),
+            }
+
+        fetched = await asyncio.to_thread(
+            _execute_batch,
+            service,
+            [
                 service.users()
                 .messages()
                 .get(
                     userId="me",
                     id=stub["id"],
                     format="metadata",
-                    metadataHeaders=["Subject", "From", "Date"],
+                    metadataHeaders=sorted(LIST_HEADERS),
                 )
-                .execute()
-            )
-            headers = {
-                h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])
-            }
+                for stub in stubs
+            ],
+            http=_get_http(ctx),
+        )
+        messages = []
+        for stub, msg in zip(stubs, fetched):
+            if "error" in msg:
+                messages.append({"id": stub["id"], **msg})
+                continue
+            headers = _pick_headers(msg.get("payload", {}), LIST_HEADERS)
             messages.append(
                 {
                     "id": msg["id"],
@@ -400,23 +828,56 @@ def gmail_list_messages(
         return {"error": str(e)}
 
 
+# Message content never changes, so parsed messages are kept in a small LRU.
+# Tools that change a message's labels evict it once their API call is done,
+# and deleting a label clears the whole cache.
+MESSAGE_CACHE_SIZE = 256
+_message_cache: OrderedDict[str, dict] = OrderedDict()
+# Bumped on every invalidation, so a fetch that was in flight meanwhile does
+# not re-insert what it read before the change.
+_message_cache_generation = 0
+
+
+def _invalidate_messages(message_ids: list[str] | None = None) -> None:
+    """Drop the given messages from the cache, or all of them if None."""
+    global _message_cache_generation
+    _message_cache_generation += 1
+    if message_ids is None:
+        _message_cache.clear()
+        return
+    for message_id in message_ids:
+        _message_cache.pop(message_id, None)
+
+
 @mcp.tool()
-def gmail_get_message(ctx: Context, message_id: str) -> dict:
+async def gmail_get_message(ctx: Context, message_id: str) -> dict:
     """Get a single email message by ID with full body, headers, and attachments.
 
+    Parsed messages are cached; labels changed outside this server may be
+    stale until the message is evicted.
+
     Args:
         ctx: MCP context (injected automatically).
         message_id: The Gmail message ID.
     """
+    cached = _message_cache.get(message_id)
+    if cached is not None:
+        _message_cache.move_to_end(message_id)
+        return cached
+    generation = _message_cache_generation
     try:
         service = _get_service(ctx)
-        msg = (
+        msg = await _execute(
             service.users()
             .messages()
             .get(userId="me", id=message_id, format="full")
-            .execute()
         )
-        return _parse_full_message(msg)
+        parsed = _parse_full_message(msg)
+        if generation == _message_cache_generation:
+            _message_cache[message_id] = parsed
+            if len(_message_cache) > MESSAGE_CACHE_SIZE:
+                _message_cache.popitem(last=False)
+        return parsed
     except HttpError as e:
         return {"error": str(e), "status_code": e.resp.status}
     except Exception as e:
@@ -424,7 +885,7 @@ def gmail_get_message(ctx: Context, message_id: str) -> dict:
 
 
 @mcp.tool()
-def gmail_search_messages(
+async def gmail_search_messages(
     ctx: Context,
     query: str,
     max_results: int = 10,
@@ -447,23 +908,30 @@ def gmail_search_messages(
         if page_token:
             kwargs["pageToken"] = page_token
 
-        response = service.users().messages().list(**kwargs).execute()
-        messages = []
-        for stub in response.get("messages", []):
-            msg = (
+        response = await _execute(service.users().messages().list(**kwargs))
+        stubs = response.get("messages", [])
+        fetched = await asyncio.to_thread(
+            _execute_batch,
+            service,
+            [
                 service.users()
                 .messages()
                 .get(
                     userId="me",
                     id=stub["id"],
                     format="metadata",
-                    metadataHeaders=["Subject", "From", "To", "Date"],
+                    metadataHeaders=sorted(SEARCH_HEADERS),
                 )
-                .execute()
-            )
-            headers = {
-                h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])
-            }
+                for stub in stubs
+            ],
+            http=_get_http(ctx),
+        )
+        messages = []
+        for stub, msg in zip(stubs, fetched):
+            if "error" in msg:
+                messages.append({"id": stub["id"], **msg})
+                continue
+            headers = _pick_headers(msg.get("payload", {}), SEARCH_HEADERS)
             messages.append(
                 {
                     "id": msg["id"],
@@ -488,7 +956,7 @@ def gmail_search_messages(
 
 
 @mcp.tool()
-def gmail_list_drafts(
+async def gmail_list_drafts(
     ctx: Context,
     max_results: int = 20,
     page_token: str | None = None,
@@ -510,19 +978,26 @@ def gmail_list_drafts(
         if query:
             kwargs["q"] = query
 
-        response = service.users().drafts().list(**kwargs).execute()
-        drafts = []
-        for stub in response.get("drafts", []):
-            draft = (
+        response = await _execute(service.users().drafts().list(**kwargs))
+        stubs = response.get("drafts", [])
+        fetched = await asyncio.to_thread(
+            _execute_batch,
+            service,
+            [
                 service.users()
                 .drafts()
                 .get(userId="me", id=stub["id"], format="metadata")
-                .execute()
-            )
+                for stub in stubs
+            ],
+            http=_get_http(ctx),
+        )
+        drafts = []
+        for stub, draft in zip(stubs, fetched):
+            if "error" in draft:
+                drafts.append({"draft_id": stub["id"], **draft})
+                continue
             msg = draft.get("message", {})
-            headers = {
-                h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])
-            }
+            headers = _pick_headers(msg.get("payload", {}), DRAFT_HEADERS)
             drafts.append(
                 {
                     "draft_id": draft["id"],
@@ -544,7 +1019,7 @@ def gmail_list_drafts(
 
 
 @mcp.tool()
-def gmail_send_message(
+async def gmail_send_message(
     ctx: Context,
     to: str,
     subject: str,
@@ -571,7 +1046,8 @@ def gmail_send_message(
         thread_id: Gmail thread ID to place this message in.
     """
     try:
-        message_body = _build_message(
+        message_body = await asyncio.to_thread(
+            _build_message,
             to=to,
             subject=subject,
             body=body,
@@ -583,7 +1059,9 @@ def gmail_send_message(
             thread_id=thread_id,
         )
         service = _get_service(ctx)
-        sent = service.users().messages().send(userId="me", body=message_body).execute()
+        sent = await _execute(
+            service.users().messages().send(userId="me", body=message_body)
+        )
         return {
             "id": sent["id"],
             "thread_id": sent.get("threadId", ""),
@@ -596,7 +1074,7 @@ def gmail_send_message(
 
 
 @mcp.tool()
-def gmail_create_draft(
+async def gmail_create_draft(
     ctx: Context,
     to: str,
     subject: str,
@@ -623,7 +1101,8 @@ def gmail_create_draft(
         thread_id: Gmail thread ID to place this draft in.
     """
     try:
-        message_body = _build_message(
+        message_body = await asyncio.to_thread(
+            _build_message,
             to=to,
             subject=subject,
             body=body,
@@ -635,11 +1114,10 @@ def gmail_create_draft(
             thread_id=thread_id,
         )
         service = _get_service(ctx)
-        draft = (
+        draft = await _execute(
             service.users()
             .drafts()
             .create(userId="me", body={"message": message_body})
-            .execute()
         )
         return {"draft_id": draft["id"], "message_id": draft["message"]["id"]}
     except HttpError as e:
@@ -649,7 +1127,7 @@ def gmail_create_draft(
 
 
 @mcp.tool()
-def gmail_update_draft(
+async def gmail_update_draft(
     ctx: Context,
     draft_id: str,
     to: str | None = None,
@@ -660,7 +1138,8 @@ def gmail_update_draft(
     html_body: str | None = None,
     attachment_paths: list[str] | None = None,
 ) -> dict:
-    """Update an existing draft. Only provided fields are changed.
+    """Update an existing draft. Only provided fields are changed; at least one
+    field must be provided.
 
     Note: Gmail replaces the entire draft — the underlying message ID will change.
 
@@ -676,17 +1155,22 @@ def gmail_update_draft(
         attachment_paths: New file attachments (replaces all).
     """
     try:
+        fields = (to, subject, body, cc, bcc, html_body)
+        if attachment_paths is None and all(f is None for f in fields):
+            return {"error": "Provide at least one field to update"}
+
         service = _get_service(ctx)
-        existing = (
-            service.users()
-            .drafts()
-            .get(userId="me", id=draft_id, format="raw")
-            .execute()
-        )
-        raw_data = existing.get("message", {}).get("raw", "")
-        current = _parse_raw_draft(raw_data)
+        current = {}
+        if any(f is None for f in fields):
+            existing = await _execute(
+                service.users()
+                .drafts()
+                .get(userId="me", id=draft_id, format="full")
+            )
+            current = _parse_draft_message(existing.get("message", {}))
 
-        message_body = _build_message(
+        message_body = await asyncio.to_thread(
+            _build_message,
             to=to if to is not None else current.get("to", ""),
             subject=subject if subject is not None else current.get("subject", ""),
             body=body if body is not None else current.get("body", ""),
@@ -695,11 +1179,10 @@ def gmail_update_draft(
             html_body=html_body if html_body is not None else current.get("html_body"),
             attachment_paths=attachment_paths,
         )
-        updated = (
+        updated = await _execute(
             service.users()
             .drafts()
             .update(userId="me", id=draft_id, body={"message": message_body})
-            .execute()
         )
         return {"draft_id": updated["id"], "message_id": updated["message"]["id"]}
     except HttpError as e:
@@ -709,7 +1192,7 @@ def gmail_update_draft(
 
 
 @mcp.tool()
-def gmail_delete_draft(ctx: Context, draft_id: str) -> dict:
+async def gmail_delete_draft(ctx: Context, draft_id: str) -> dict:
     """Permanently delete a draft. This cannot be undone.
 
     Args:
@@ -718,7 +1201,7 @@ def gmail_delete_draft(ctx: Context, draft_id: str) -> dict:
     """
     try:
         service = _get_service(ctx)
-        service.users().drafts().delete(userId="me", id=draft_id).execute()
+        await _execute(service.users().drafts().delete(userId="me", id=draft_id))
         return {"success": True}
     except HttpError as e:
         return {"error": str(e), "status_code": e.resp.status}
@@ -727,7 +1210,7 @@ def gmail_delete_draft(ctx: Context, draft_id: str) -> dict:
 
 
 @mcp.tool()
-def gmail_send_draft(ctx: Context, draft_id: str) -> dict:
+async def gmail_send_draft(ctx: Context, draft_id: str) -> dict:
     """Send an existing draft. The draft is deleted after sending.
 
     Args:
@@ -736,8 +1219,8 @@ def gmail_send_draft(ctx: Context, draft_id: str) -> dict:
     """
     try:
         service = _get_service(ctx)
-        result = (
-            service.users().drafts().send(userId="me", body={"id": draft_id}).execute()
+        result = await _execute(
+            service.users().drafts().send(userId="me", body={"id": draft_id})
         )
         return {"message_id": result["id"], "thread_id": result.get("threadId", "")}
     except HttpError as e:
@@ -746,21 +1229,40 @@ def gmail_send_draft(ctx: Context, draft_id: str) -> dict:
         return {"error": str(e)}
 
 
+# Labels rarely change, and agents list them before most label operations.
+LABELS_CACHE_TTL = 300.0
+_labels_cache: tuple[float, dict] | None = None
+
+
+def _invalidate_labels_cache() -> None:
+    global _labels_cache
+    _labels_cache = None
+
+
 @mcp.tool()
-def gmail_list_labels(ctx: Context) -> dict:
+async def gmail_list_labels(ctx: Context) -> dict:
     """List all labels in the user's mailbox (system and user-created).
 
+    Results are cached for 5 minutes; creating or deleting a label clears the cache.
+
     Args:
         ctx: MCP context (injected automatically).
     """
+    global _labels_cache
+    now = time.monotonic()
+    cached = _labels_cache
+    if cached and now - cached[0] < LABELS_CACHE_TTL:
+        return cached[1]
     try:
         service = _get_service(ctx)
-        response = service.users().labels().list(userId="me").execute()
+        response = await _execute(service.users().labels().list(userId="me"))
         labels = [
             {"id": l["id"], "name": l["name"], "type": l.get("type", "")}
             for l in response.get("labels", [])
         ]
-        return {"labels": labels}
+        result = {"labels": labels}
+        _labels_cache = (now, result)
+        return result
     except HttpError as e:
         return {"error": str(e), "status_code": e.resp.status}
     except Exception as e:
@@ -768,7 +1270,7 @@ def gmail_list_labels(ctx: Context) -> dict:
 
 
 @mcp.tool()
-def gmail_create_label(ctx: Context, name: str) -> dict:
+async def gmail_create_label(ctx: Context, name: str) -> dict:
     """Create a new user label. Use "/" for nesting (e.g. "Projects/Work").
 
     Args:
@@ -777,7 +1279,7 @@ def gmail_create_label(ctx: Context, name: str) -> dict:
     """
     try:
         service = _get_service(ctx)
-        label = (
+        label = await _execute(
             service.users()
             .labels()
             .create(
@@ -788,8 +1290,8 @@ def gmail_create_label(ctx: Context, name: str) -> dict:
                     "messageListVisibility": "show",
                 },
             )
-            .execute()
         )
+        _invalidate_labels_cache()
         return {"id": label["id"], "name": label["name"]}
     except HttpError as e:
         return {"error": str(e), "status_code": e.resp.status}
@@ -798,7 +1300,7 @@ def gmail_create_label(ctx: Context, name: str) -> dict:
 
 
 @mcp.tool()
-def gmail_delete_label(ctx: Context, label_id: str) -> dict:
+async def gmail_delete_label(ctx: Context, label_id: str) -> dict:
     """Delete a user label. System labels cannot be deleted.
 
     Args:
@@ -807,7 +1309,9 @@ def gmail_delete_label(ctx: Context, label_id: str) -> dict:
     """
     try:
         service = _get_service(ctx)
-        service.users().labels().delete(userId="me", id=label_id).execute()
+        await _execute(service.users().labels().delete(userId="me", id=label_id))
+        _invalidate_labels_cache()
+        _invalidate_messages()  # cached messages may still carry the label
         return {"success": True}
     except HttpError as e:
         return {"error": str(e), "status_code": e.resp.status}
@@ -816,7 +1320,7 @@ def gmail_delete_label(ctx: Context, label_id: str) -> dict:
 
 
 @mcp.tool()
-def gmail_modify_message_labels(
+async def gmail_modify_message_labels(
     ctx: Context,
     message_id: str,
     add_label_ids: list[str] | None = None,
@@ -841,21 +1345,74 @@ def gmail_modify_message_labels(
             return {
                 "error": "Provide at least one of add_label_ids or remove_label_ids"
             }
-        result = (
+        result = await _execute(
             service.users()
             .messages()
             .modify(userId="me", id=message_id, body=body)
-            .execute()
         )
         return {"id": result["id"], "label_ids": result.get("labelIds", [])}
     except HttpError as e:
         return {"error": str(e), "status_code": e.resp.status}
     except Exception as e:
         return {"error": str(e)}
+    finally:
+        _invalidate_messages([message_id])
+
+
+@mcp.tool()
+async def gmail_batch_modify_messages(
+    ctx: Context,
+    message_ids: list[str],
+    add_label_ids: list[str] | None = None,
+    remove_label_ids: list[str] | None = None,
+) -> dict:
+    """Add or remove labels on many messages at once.
+
+    Uses one API call per 1000 messages instead of one call per message.
+    If a later call fails, the error result's modified_count says how many
+    messages (in input order) were already modified.
+
+    Args:
+        ctx: MCP context (injected automatically).
+        message_ids: The message IDs to modify.
+        add_label_ids: Label IDs to add (e.g. ["STARRED"]).
+        remove_label_ids: Label IDs to remove (e.g. ["UNREAD", "INBOX"]).
+    """
+    modified = 0
+    try:
+        service = _get_service(ctx)
+        body = {}
+        if add_label_ids:
+            body["addLabelIds"] = add_label_ids
+        if remove_label_ids:
+            body["removeLabelIds"] = remove_label_ids
+        if not body:
+            return {
+                "error": "Provide at least one of add_label_ids or remove_label_ids"
+            }
+        for start in range(0, len(message_ids), BATCH_MODIFY_SIZE):
+            chunk = message_ids[start : start + BATCH_MODIFY_SIZE]
+            await _execute(
+                service.users()
+                .messages()
+                .batchModify(userId="me", body={"ids": chunk, **body})
+            )
+            modified += len(chunk)
+        return {"success": True, "modified_count": modified}
+    except HttpError as e:
+        return {
+            "error": str(e),
+            "status_code": e.resp.status,
+            "modified_count": modified,
+        }
+    except Exception as e:
+        return {"error": str(e), "modified_count": modified}
+    finally:
+        _invalidate_messages(message_ids)
 
 
 @mcp.tool()
-def gmail_trash_message(ctx: Context, message_id: str) -> dict:
+async def gmail_trash_message(ctx: Context, message_id: str) -> dict:
     """Move a message to trash. Auto-deleted after 30 days.
 
     Args:
@@ -864,16 +1421,20 @@ def gmail_trash_message(ctx: Context, message_id: str) -> dict:
     """
     try:
         service = _get_service(ctx)
-        result = service.users().messages().trash(userId="me", id=message_id).execute()
+        result = await _execute(
+            service.users().messages().trash(userId="me", id=message_id)
+        )
         return {"id": result["id"], "label_ids": result.get("labelIds", [])}
     except HttpError as e:
         return {"error": str(e), "status_code": e.resp.status}
     except Exception as e:
         return {"error": str(e)}
+    finally:
+        _invalidate_messages([message_id])
 
 
 @mcp.tool()
-def gmail_untrash_message(ctx: Context, message_id: str) -> dict:
+async def gmail_untrash_message(ctx: Context, message_id: str) -> dict:
     """Restore a message from trash.
 
     Args:
@@ -882,14 +1443,54 @@ def gmail_untrash_message(ctx: Context, message_id: str) -> dict:
     """
     try:
         service = _get_service(ctx)
-        result = (
-            service.users().messages().untrash(userId="me", id=message_id).execute()
+        result = await _execute(
+            service.users().messages().untrash(userId="me", id=message_id)
         )
         return {"id": result["id"], "label_ids": result.get("labelIds", [])}
     except HttpError as e:
         return {"error": str(e), "status_code": e.resp.status}
     except Exception as e:
         return {"error": str(e)}
+    finally:
+        _invalidate_messages([message_id])
+
+
+@mcp.tool()
+async def gmail_batch_trash_messages(ctx: Context, message_ids: list[str]) -> dict:
+    """Move many messages to trash at once. Auto-deleted after 30 days.
+
+    Trash calls are sent in batches of up to 50 per HTTP request.
+
+    Args:
+        ctx: MCP context (injected automatically).
+        message_ids: The message IDs to trash.
+    """
+    try:
+        service = _get_service(ctx)
+        results = await asyncio.to_thread(
+            _execute_batch,
+            service,
+            [
+                service.users().messages().trash(userId="me", id=message_id)
+                for message_id in message_ids
+            ],
+            http=_get_http(ctx),
+        )
+        messages = []
+        for message_id, result in zip(message_ids, results):
+            if "error" in result:
+                messages.append({"id": message_id, **result})
+            else:
+                messages.append(
+                    {"id": result["id"], "label_ids": result.get("labelIds", [])}
+                )
+        return {"messages": messages}
+    except HttpError as e:
+        return {"error": str(e), "status_code": e.resp.status}
+    except Exception as e:
+        return {"error": str(e)}
+    finally:
+        _invalidate_messages(message_ids)
 
 
 # ---------------------------------------------------------------------------